@@ -7,6 +7,7 @@ network traffic or AIS cluster is required.
 """
 
 import unittest
+from types import MappingProxyType
 from unittest.mock import Mock, patch, mock_open
 from json import dumps as json_dumps
 
@@ -56,6 +57,7 @@ from aistore.sdk.obj.object_reader import ObjectReader
 from aistore.sdk.archive_config import ArchiveMode, ArchiveConfig
 from aistore.sdk.etl import ETLConfig
 from aistore.sdk.obj.object_props import ObjectProps
+from aistore.sdk.request_client import RequestClient
 from aistore.sdk.types import (
     ActionMsg,
     BlobMsg,
@@ -69,25 +71,114 @@ BCK_NAME = "bucket_name"
 OBJ_NAME = "object_name"
 DEST_BCK_NAME = "dest-bucket"
 REQUEST_PATH = f"{URL_PATH_OBJECTS}/{BCK_NAME}/{OBJ_NAME}"
+PROVIDER_AIS = Provider.AIS.value
+SRC_PATH_PREFIX = f"ais/@#/{BCK_NAME}/"
+DEST_PATH_PREFIX = f"ais/@#/{DEST_BCK_NAME}/"
+PROMOTE_FILENAME = "promoted file"
+PROMOTE_TARGET_ID = "target node"
+APPEND_HANDLE = "TEST_HANDLE"
+ETL_ARGS = {"seed": "42", "mode": "test"}
+ETL_ARGS_JSON = json_dumps(ETL_ARGS, separators=(",", ":"))
+
+PROPS_HEADERS = CaseInsensitiveDict(
+    {
+        "Ais-Atime": "1722021816727999173",
+        "Ais-Bucket-Name": "data-bck",
+        "Ais-Bucket-Provider": "ais",
+        "Ais-Checksum-Type": "xxhash",
+        "Ais-Checksum-Value": "ecc0a7bf787e089e",
+        "Ais-Location": "t[LSJt8081]:mp[/tmp/ais/mp1/1, [sda sdb]]",
+        "Ais-Mirror-Copies": "1",
+        "Ais-Mirror-Paths": "[/tmp/ais/mp1/1]",
+        "Ais-Name": "cifar-10-batches-py/batches.meta",
+        "Ais-Present": "true",
+        "Ais-Version": "1",
+        "Content-Length": "158",
+        "Date": "Wed, 31 Jul 2024 16:55:14 GMT",
+    }
+)
+APPEND_HEADERS = CaseInsensitiveDict({HEADER_OBJECT_APPEND_HANDLE: APPEND_HANDLE})
+EMPTY_HEADERS = CaseInsensitiveDict({})
 
 
-# pylint: disable=unused-variable, too-many-locals, too-many-public-methods, no-value-for-parameter
+# pylint: disable=unused-variable, too-many-locals, too-many-public-methods
 class TestObject(unittest.TestCase):
     """Comprehensive unit tests for ``aistore.sdk.obj.object.Object``."""
 
+    _DEST_DETAILS = BucketDetails(
+        DEST_BCK_NAME, Provider.AIS, {"provider": PROVIDER_AIS}, DEST_PATH_PREFIX
+    )
+
+    _CUSTOM_METADATA = {"key1": "value1", "key2": "value2"}
+    _EXPECTED_CUSTOM_PROPS_JSON = ActionMsg.model_construct(
+        action="", value=_CUSTOM_METADATA
+    ).model_dump()
+    _EXPECTED_PROMOTE_DEFAULT_JSON = ActionMsg.model_construct(
+        action=ACT_PROMOTE,
+        name=PROMOTE_FILENAME,
+        value=PromoteAPIArgs.model_construct(
+            source_path=PROMOTE_FILENAME, object_name=OBJ_NAME
+        ).as_dict(),
+    ).model_dump()
+    _EXPECTED_PROMOTE_JSON = ActionMsg.model_construct(
+        action=ACT_PROMOTE,
+        name=PROMOTE_FILENAME,
+        value=PromoteAPIArgs.model_construct(
+            source_path=PROMOTE_FILENAME,
+            object_name=OBJ_NAME,
+            target_id=PROMOTE_TARGET_ID,
+            recursive=True,
+            overwrite_dest=True,
+            delete_source=True,
+            src_not_file_share=True,
+        ).as_dict(),
+    ).model_dump()
+    _EXPECTED_BLOB_DEFAULT_JSON = ActionMsg.model_construct(
+        action=ACT_BLOB_DOWNLOAD,
+        name=OBJ_NAME,
+        value=BlobMsg.model_construct(
+            chunk_size=None, num_workers=None, latest=False
+        ).as_dict(),
+    ).model_dump()
+    _EXPECTED_BLOB_CUSTOM_JSON = ActionMsg.model_construct(
+        action=ACT_BLOB_DOWNLOAD,
+        name=OBJ_NAME,
+        value=BlobMsg.model_construct(
+            chunk_size=SMALL_FILE_SIZE, num_workers=10, latest=True
+        ).as_dict(),
+    ).model_dump()
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Read-only, since all tests share these bucket details
+        cls._bck_qparams_template = MappingProxyType({"propkey": "propval"})
+        cls._bucket_details_template = BucketDetails(
+            BCK_NAME, PROVIDER_AIS, cls._bck_qparams_template, SRC_PATH_PREFIX
+        )
+        cls._MOCK_FILE = mock_open(read_data=b"file content")
+        cls._p_validate_file = patch("aistore.sdk.obj.object_writer.validate_file")
+        cls._mock_validate_file = cls._p_validate_file.start()
+        cls.addClassCleanup(cls._p_validate_file.stop)
+        cls._p_obj_client = patch("aistore.sdk.obj.object.ObjectClient")
+        cls._mock_obj_client_cls = cls._p_obj_client.start()
+        cls.addClassCleanup(cls._p_obj_client.stop)
+        cls._p_obj_reader = patch("aistore.sdk.obj.object.ObjectReader")
+        cls._mock_obj_reader_cls = cls._p_obj_reader.start()
+        cls.addClassCleanup(cls._p_obj_reader.stop)
+
     def setUp(self) -> None:
-        self.mock_client = Mock()
-        self.bck_qparams = {"propkey": "propval"}
-        self.bucket_details = BucketDetails(
-            BCK_NAME, "ais", self.bck_qparams, f"ais/@#/{BCK_NAME}/"
-        )
+        self._mock_obj_client_cls.reset_mock(return_value=True, side_effect=True)
+        self._mock_obj_reader_cls.reset_mock(return_value=True, side_effect=True)
+        self.mock_client = Mock(spec_set=RequestClient)
+        self.bck_qparams = self._bck_qparams_template.copy()
+        self.bucket_details = self._bucket_details_template
         self.mock_writer = Mock()
         self.expected_params = self.bck_qparams
         self.object = Object(self.mock_client, self.bucket_details, OBJ_NAME)
 
     def test_properties(self):
         self.assertEqual(BCK_NAME, self.object.bucket_name)
-        self.assertEqual("ais", self.object.bucket_provider)
+        self.assertEqual(PROVIDER_AIS, self.object.bucket_provider)
         self.assertEqual(self.bck_qparams, self.object.query_params)
         self.assertEqual(OBJ_NAME, self.object.name)
         self.assertIsNone(self.object.props_cached)
@@ -113,9 +204,9 @@ class TestObject(unittest.TestCase):
     )
     def test_get(self, case):
         archpath_param = "archpath"
+        self.expected_params = self.bck_qparams.copy()
         self.expected_params[QPARAM_ARCHPATH] = archpath_param
         self.expected_params[QPARAM_ARCHREGX] = ""
-        self.expected_params[QPARAM_ARCHMODE] = None
         self.expected_params[QPARAM_ETL_NAME] = ETL_NAME
         self.expected_params[QPARAM_ETL_ARGS] = '{"key":"value"}'
 
@@ -155,13 +246,7 @@ class TestObject(unittest.TestCase):
     def test_get_parallel_uses_proxy(self):
         self.get_exec_assert(num_workers=4)
 
-    @patch("aistore.sdk.obj.object.ObjectReader")
-    @patch("aistore.sdk.obj.object.ObjectClient")
-    def get_exec_assert(self, mock_obj_client, mock_obj_reader, **kwargs):
-        mock_obj_client_instance = Mock(spec=ObjectClient)
-        mock_obj_client.return_value = mock_obj_client_instance
-        mock_obj_reader.return_value = Mock(spec=ObjectReader)
-
+    def get_exec_assert(self, **kwargs):
         expected_headers = kwargs.pop("expected_headers", {})
         expected_byte_range_tuple = kwargs.pop(
             "expected_byte_range_tuple", (None, None)
@@ -170,6 +255,12 @@ class TestObject(unittest.TestCase):
         expected_num_workers = kwargs.get("num_workers", None)
         expected_uname = kwargs.pop("expected_uname", None)
 
+        mock_obj_client = self._mock_obj_client_cls
+        mock_obj_reader = self._mock_obj_reader_cls
+        mock_obj_client_instance = Mock(spec=ObjectClient)
+        mock_obj_client.return_value = mock_obj_client_instance
+        mock_obj_reader.return_value = Mock(spec=ObjectReader)
+
         res = self.object.get_reader(**kwargs)
 
         self.assertIsInstance(res, ObjectReader)
@@ -222,21 +313,20 @@ class TestObject(unittest.TestCase):
             REQUEST_PATH, self.expected_params
         )
 
-    @patch("pathlib.Path.is_file")
-    @patch("pathlib.Path.exists")
-    def test_put_file(self, mock_exists, mock_is_file):
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
+    def test_put_file(self):
         path = "any/filepath"
-        mock_file = mock_open(read_data=b"file content")
-        with patch("builtins.open", mock_file):
+        self._MOCK_FILE.reset_mock()
+        self._mock_validate_file.reset_mock()
+        with patch("builtins.open", self._MOCK_FILE):
             self.object.get_writer().put_file(path)
 
+        self._mock_validate_file.assert_called_once_with(path)
+        self._MOCK_FILE.assert_called_once_with(path, "rb")
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_PUT,
             path=REQUEST_PATH,
             params=self.expected_params,
-            data=mock_file.return_value,
+            data=self._MOCK_FILE.return_value,
         )
 
     def test_put_content(self):
@@ -251,15 +341,11 @@ class TestObject(unittest.TestCase):
 
     def test_append_content(self):
         content = b"content-to-append"
-        expected_handle = "TEST_HANDLE"
         self.expected_params[QPARAM_OBJ_APPEND] = "append"
         self.expected_params[QPARAM_OBJ_APPEND_HANDLE] = ""
-        resp_headers = CaseInsensitiveDict(
-            {HEADER_OBJECT_APPEND_HANDLE: expected_handle}
+        self.mock_client.request.return_value = Mock(
+            spec=Response, headers=APPEND_HEADERS
         )
-        mock_response = Mock(Response)
-        mock_response.headers = resp_headers
-        self.mock_client.request.return_value = mock_response
 
         next_handle = self.object.get_writer().append_content(content)
         self.mock_client.request.assert_called_once_with(
@@ -268,17 +354,16 @@ class TestObject(unittest.TestCase):
             params=self.expected_params,
             data=content,
         )
-        self.assertEqual(next_handle, expected_handle)
+        self.assertEqual(next_handle, APPEND_HANDLE)
 
     def test_append_flush(self):
         expected_handle = ""
         prev_handle = "prev_handle"
         self.expected_params[QPARAM_OBJ_APPEND] = "flush"
         self.expected_params[QPARAM_OBJ_APPEND_HANDLE] = prev_handle
-        resp_headers = CaseInsensitiveDict({})
-        mock_response = Mock(Response)
-        mock_response.headers = resp_headers
-        self.mock_client.request.return_value = mock_response
+        self.mock_client.request.return_value = Mock(
+            spec=Response, headers=EMPTY_HEADERS
+        )
 
         next_handle = self.object.get_writer().append_content(b"", prev_handle, True)
         self.mock_client.request.assert_called_once_with(
@@ -290,70 +375,45 @@ class TestObject(unittest.TestCase):
         self.assertEqual(next_handle, expected_handle)
 
     def test_set_custom_props(self):
-        custom_metadata = {"key1": "value1", "key2": "value2"}
-        expected_json_val = ActionMsg(action="", value=custom_metadata).model_dump()
-
-        self.object.get_writer().set_custom_props(custom_metadata)
+        self.object.get_writer().set_custom_props(self._CUSTOM_METADATA)
 
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_PATCH,
             path=REQUEST_PATH,
             params=self.expected_params,
-            json=expected_json_val,
+            json=self._EXPECTED_CUSTOM_PROPS_JSON,
         )
 
     def test_set_custom_props_with_replace_existing(self):
-        custom_metadata = {"key1": "value1", "key2": "value2"}
         self.expected_params[QPARAM_NEW_CUSTOM] = "true"
-        expected_json_val = ActionMsg(action="", value=custom_metadata).model_dump()
 
         self.object.get_writer().set_custom_props(
-            custom_metadata, replace_existing=True
+            self._CUSTOM_METADATA, replace_existing=True
         )
 
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_PATCH,
             path=REQUEST_PATH,
             params=self.expected_params,
-            json=expected_json_val,
+            json=self._EXPECTED_CUSTOM_PROPS_JSON,
         )
 
     def test_promote_default_args(self):
-        filename = "promoted file"
-        expected_value = PromoteAPIArgs(source_path=filename, object_name=OBJ_NAME)
-        self.promote_exec_assert(filename, expected_value)
+        self.promote_exec_assert(PROMOTE_FILENAME, self._EXPECTED_PROMOTE_DEFAULT_JSON)
 
     def test_promote(self):
-        filename = "promoted file"
-        target_id = "target node"
-        recursive = True
-        overwrite_dest = True
-        delete_source = True
-        src_not_file_share = True
-        expected_value = PromoteAPIArgs(
-            source_path=filename,
-            object_name=OBJ_NAME,
-            target_id=target_id,
-            recursive=recursive,
-            overwrite_dest=overwrite_dest,
-            delete_source=delete_source,
-            src_not_file_share=src_not_file_share,
-        )
         self.promote_exec_assert(
-            filename,
-            expected_value,
-            target_id=target_id,
-            recursive=recursive,
-            overwrite_dest=overwrite_dest,
-            delete_source=delete_source,
-            src_not_file_share=src_not_file_share,
+            PROMOTE_FILENAME,
+            self._EXPECTED_PROMOTE_JSON,
+            target_id=PROMOTE_TARGET_ID,
+            recursive=True,
+            overwrite_dest=True,
+            delete_source=True,
+            src_not_file_share=True,
         )
 
-    def promote_exec_assert(self, filename, expected_value, **kwargs):
+    def promote_exec_assert(self, filename, expected_json, **kwargs):
         request_path = f"{URL_PATH_OBJECTS}/{BCK_NAME}"
-        expected_json = ActionMsg(
-            action=ACT_PROMOTE, name=filename, value=expected_value.as_dict()
-        ).model_dump()
         self.object.promote(filename, **kwargs)
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
@@ -370,82 +430,46 @@ class TestObject(unittest.TestCase):
 
     def test_blob_download_default_args(self):
         request_path = f"{URL_PATH_OBJECTS}/{BCK_NAME}"
-        expected_blob_msg = BlobMsg(
-            chunk_size=None,
-            num_workers=None,
-            latest=False,
-        ).as_dict()
-        expected_json = ActionMsg(
-            action=ACT_BLOB_DOWNLOAD, name=OBJ_NAME, value=expected_blob_msg
-        ).model_dump()
         self.object.blob_download()
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
             path=request_path,
             params=self.expected_params,
-            json=expected_json,
+            json=self._EXPECTED_BLOB_DEFAULT_JSON,
         )
 
     def test_blob_download(self):
         request_path = f"{URL_PATH_OBJECTS}/{BCK_NAME}"
-        chunk_size = SMALL_FILE_SIZE
-        num_workers = 10
-        latest = True
-        expected_blob_msg = BlobMsg(
-            chunk_size=chunk_size,
-            num_workers=num_workers,
-            latest=latest,
-        ).as_dict()
-        expected_json = ActionMsg(
-            action=ACT_BLOB_DOWNLOAD, name=OBJ_NAME, value=expected_blob_msg
-        ).model_dump()
         self.object.blob_download(
-            num_workers=num_workers, chunk_size=chunk_size, latest=latest
+            num_workers=10, chunk_size=SMALL_FILE_SIZE, latest=True
         )
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
             path=request_path,
             params=self.expected_params,
-            json=expected_json,
+            json=self._EXPECTED_BLOB_CUSTOM_JSON,
         )
 
     def test_object_props(self):
-
-        headers = CaseInsensitiveDict(
-            {
-                "Ais-Atime": "1722021816727999173",
-                "Ais-Bucket-Name": "data-bck",
-                "Ais-Bucket-Provider": "ais",
-                "Ais-Checksum-Type": "xxhash",
-                "Ais-Checksum-Value": "ecc0a7bf787e089e",
-                "Ais-Location": "t[LSJt8081]:mp[/tmp/ais/mp1/1, [sda sdb]]",
-                "Ais-Mirror-Copies": "1",
-                "Ais-Mirror-Paths": "[/tmp/ais/mp1/1]",
-                "Ais-Name": "cifar-10-batches-py/batches.meta",
-                "Ais-Present": "true",
-                "Ais-Version": "1",
-                "Content-Length": "158",
-                "Date": "Wed, 31 Jul 2024 16:55:14 GMT",
-            }
+        self.mock_client.request.return_value = Mock(
+            spec=Response, headers=PROPS_HEADERS
         )
 
-        self.mock_client.request.return_value = Mock(headers=headers)
-
         self.assertEqual(self.object.props_cached, None)
 
         self.object.head()
 
         props: ObjectProps = self.object.props
 
-        self.assertEqual(props.bucket_name, headers[AIS_BCK_NAME])
-        self.assertEqual(props.bucket_provider, headers[AIS_BCK_PROVIDER])
-        self.assertEqual(props.name, headers[AIS_OBJ_NAME])
-        self.assertEqual(props.location, headers[AIS_LOCATION])
+        self.assertEqual(props.bucket_name, PROPS_HEADERS[AIS_BCK_NAME])
+        self.assertEqual(props.bucket_provider, PROPS_HEADERS[AIS_BCK_PROVIDER])
+        self.assertEqual(props.name, PROPS_HEADERS[AIS_OBJ_NAME])
+        self.assertEqual(props.location, PROPS_HEADERS[AIS_LOCATION])
         self.assertEqual(
-            props.mirror_paths, headers[AIS_MIRROR_PATHS].strip("[]").split(",")
+            props.mirror_paths, PROPS_HEADERS[AIS_MIRROR_PATHS].strip("[]").split(",")
         )
-        self.assertEqual(props.mirror_copies, int(headers[AIS_MIRROR_COPIES]))
-        self.assertEqual(props.present, headers[AIS_PRESENT] == "true")
+        self.assertEqual(props.mirror_copies, int(PROPS_HEADERS[AIS_MIRROR_COPIES]))
+        self.assertEqual(props.present, PROPS_HEADERS[AIS_PRESENT] == "true")
 
     def test_generate_object_props(self):
         entry = BucketEntry(
@@ -469,11 +493,11 @@ class TestObject(unittest.TestCase):
             BCK_NAME,
             Provider.AIS,
             self.bck_qparams,
-            f"ais/@#/{BCK_NAME}/",
+            SRC_PATH_PREFIX,
         )
         temp_obj = Object(self.mock_client, temp_details, OBJ_NAME)
 
-        expected = f"{Provider.AIS.value}://{BCK_NAME}/{OBJ_NAME}"
+        expected = f"{PROVIDER_AIS}://{BCK_NAME}/{OBJ_NAME}"
         self.assertEqual(temp_obj.get_semantic_url(), expected)
 
     def test_get_url_with_etl_args(self):
@@ -503,126 +527,43 @@ class TestObject(unittest.TestCase):
 
     def test_get_reader_latest_param(self):
         """Ensure get_reader sets ?latest=true when latest flag is provided."""
-        with patch("aistore.sdk.obj.object.ObjectClient") as mock_client_cls:
-            mock_client = Mock()
-            mock_client_cls.return_value = mock_client
-
-            with patch("aistore.sdk.obj.object.ObjectReader") as mock_reader_cls:
-                mock_reader = Mock()
-                mock_reader_cls.return_value = mock_reader
-
-                self.object.get_reader(latest=True)
-                args, kwargs = mock_client_cls.call_args
-                params_passed = kwargs.get("params", {})
-                self.assertIn(QPARAM_LATEST, params_passed)
-                self.assertEqual(params_passed[QPARAM_LATEST], "true")
-
-    def test_copy_same_name(self):
-        """Test copying object with same name to another bucket."""
-        dest_bucket_details = BucketDetails(
-            DEST_BCK_NAME, Provider.AIS, {"provider": "ais"}, f"ais/@#/{DEST_BCK_NAME}/"
-        )
-        dest_object = Object(self.mock_client, dest_bucket_details, OBJ_NAME)
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        self.mock_client.request.return_value = mock_response
-
-        response = self.object.copy(dest_object)
-
-        self.assertEqual(response, mock_response)
-        expected_params = self.bck_qparams.copy()
-        expected_params[QPARAM_OBJ_TO] = f"ais/@#/{DEST_BCK_NAME}/{OBJ_NAME}"
-        expected_params[QPARAM_LATEST] = "false"
-        expected_params[QPARAM_SYNC] = "false"
-
-        self.mock_client.request.assert_called_once_with(
-            HTTP_METHOD_PUT,
-            path=REQUEST_PATH,
-            params=expected_params,
-        )
-
-    def test_copy_different_name(self):
-        """Test copying object with different name to another bucket."""
-        new_name = "copied-object.txt"
-        dest_bucket_details = BucketDetails(
-            DEST_BCK_NAME, Provider.AIS, {"provider": "ais"}, f"ais/@#/{DEST_BCK_NAME}/"
-        )
-        dest_object = Object(self.mock_client, dest_bucket_details, new_name)
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        self.mock_client.request.return_value = mock_response
-
-        response = self.object.copy(dest_object)
-
-        self.assertEqual(response, mock_response)
-        expected_params = self.bck_qparams.copy()
-        expected_params[QPARAM_OBJ_TO] = f"ais/@#/{DEST_BCK_NAME}/{new_name}"
-        expected_params[QPARAM_LATEST] = "false"
-        expected_params[QPARAM_SYNC] = "false"
-
-        self.mock_client.request.assert_called_once_with(
-            HTTP_METHOD_PUT,
-            path=REQUEST_PATH,
-            params=expected_params,
-        )
-
-    def test_copy_with_etl(self):
-        """Test copying object with ETL transformation."""
-        dest_bucket_details = BucketDetails(
-            DEST_BCK_NAME, Provider.AIS, {"provider": "ais"}, f"ais/@#/{DEST_BCK_NAME}/"
-        )
-        dest_object = Object(self.mock_client, dest_bucket_details, OBJ_NAME)
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        self.mock_client.request.return_value = mock_response
-
-        etl_config = ETLConfig(name=ETL_NAME)
-
-        response = self.object.copy(dest_object, etl=etl_config)
-
-        self.assertEqual(response, mock_response)
-        expected_params = self.bck_qparams.copy()
-        expected_params[QPARAM_OBJ_TO] = f"ais/@#/{DEST_BCK_NAME}/{OBJ_NAME}"
-        expected_params[QPARAM_ETL_NAME] = ETL_NAME
-        expected_params[QPARAM_LATEST] = "false"
-        expected_params[QPARAM_SYNC] = "false"
-
-        self.mock_client.request.assert_called_once_with(
-            HTTP_METHOD_PUT,
-            path=REQUEST_PATH,
-            params=expected_params,
-        )
-
-    def test_copy_with_etl_args(self):
-        """Test copying object with ETL transformation and etl_args."""
-        dest_bucket_details = BucketDetails(
-            DEST_BCK_NAME, Provider.AIS, {"provider": "ais"}, f"ais/@#/{DEST_BCK_NAME}/"
-        )
-        dest_object = Object(self.mock_client, dest_bucket_details, OBJ_NAME)
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        self.mock_client.request.return_value = mock_response
-
-        etl_config = ETLConfig(name=ETL_NAME, args={"seed": "42", "mode": "test"})
-
-        response = self.object.copy(dest_object, etl=etl_config)
-
-        self.assertEqual(response, mock_response)
-        expected_params = self.bck_qparams.copy()
-        expected_params[QPARAM_OBJ_TO] = f"ais/@#/{DEST_BCK_NAME}/{OBJ_NAME}"
-        expected_params[QPARAM_ETL_NAME] = ETL_NAME
-        expected_params[QPARAM_ETL_ARGS] = json_dumps(
-            etl_config.args, separators=(",", ":")
-        )
-        expected_params[QPARAM_LATEST] = "false"
-        expected_params[QPARAM_SYNC] = "false"
-
-        self.mock_client.request.assert_called_once_with(
-            HTTP_METHOD_PUT,
-            path=REQUEST_PATH,
-            params=expected_params,
-        )
+        self.object.get_reader(latest=True)
+        args, kwargs = self._mock_obj_client_cls.call_args
+        params_passed = kwargs.get("params", {})
+        self.assertIn(QPARAM_LATEST, params_passed)
+        self.assertEqual(params_passed[QPARAM_LATEST], "true")
+
+    def test_copy(self):
+        """Test copying an object to another bucket, with and without ETL."""
+        test_cases = [
+            (OBJ_NAME, None, None),
+            ("copied-object.txt", None, None),
+            (OBJ_NAME, ETLConfig(name=ETL_NAME), None),
+            (OBJ_NAME, ETLConfig(name=ETL_NAME, args=ETL_ARGS), ETL_ARGS_JSON),
+        ]
+        for dest_name, etl_config, etl_args_json in test_cases:
+            with self.subTest(dest_name=dest_name, etl=etl_config):
+                self.mock_client.reset_mock()
+                dest_object = Object(self.mock_client, self._DEST_DETAILS, dest_name)
+
+                mock_response = Mock()
+                mock_response.status_code = 200
+                self.mock_client.request.return_value = mock_response
+
+                response = self.object.copy(dest_object, etl=etl_config)
+
+                self.assertEqual(response, mock_response)
+                expected_params = self.bck_qparams.copy()
+                expected_params[QPARAM_OBJ_TO] = f"{DEST_PATH_PREFIX}{dest_name}"
+                if etl_config:
+                    expected_params[QPARAM_ETL_NAME] = ETL_NAME
+                if etl_args_json:
+                    expected_params[QPARAM_ETL_ARGS] = etl_args_json
+                expected_params[QPARAM_LATEST] = "false"
+                expected_params[QPARAM_SYNC] = "false"
+
+                self.mock_client.request.assert_called_once_with(
+                    HTTP_METHOD_PUT,
+                    path=REQUEST_PATH,
+                    params=expected_params,
+                )